@@ -1,8 +1,9 @@
+from os import stat
 from os.path import join
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from re import match
+from threading import Lock
 
-import itertools as itr
 import typing as ty
 
 # 3rd party
@@ -29,6 +30,11 @@ DAYS_PATTERN = f"^{'(M|T|W|Th|F|S|U)?'*7}$"
 FH_TYPE_ALIAS = {'standard': None, 'online': 'W', 'hybrid': 'Y'}
 DA_TYPE_ALIAS = {'standard': None, 'online': 'Z', 'hybrid': 'Y'}
 
+SECTION_STATUSES = ('open', 'waitlist', 'full')
+SECTION_TYPES = ('standard', 'online', 'hybrid')
+
+BATCH_CACHE_SIZE = 1024
+
 
 @application.route('/')
 def idx():
@@ -107,13 +113,16 @@ def api_many(campus):
     if campus not in CAMPUS_LIST:
         return 'Error! Could not find campus in database', 404
 
-    db = TinyDB(join(DB_ROOT, f'{CAMPUS_LIST[campus]}_database.json'))
+    db_path = join(DB_ROOT, f'{CAMPUS_LIST[campus]}_database.json')
+    db = TinyDB(db_path)
     raw = request.get_json()
 
     data = raw['courses']
-    filters = raw['filters'] if ('filters' in raw) else dict()
+    filters = raw.get('filters') or dict()
 
-    courses = get_many(db=db, data=data, filters=filters)
+    generation = BATCH_CACHE.sync(campus, snapshot_generation(db_path))
+    courses = get_many(db=db, data=data, filters=filters, cache=BATCH_CACHE,
+                       campus=campus, generation=generation)
     if not courses:  # null case from get_one (invalid param or filter)
         return 'Error! Could not find one or more course selectors in database', 404
 
@@ -150,7 +159,7 @@ def get_one(db: TinyDB, data: dict, filters: dict):
             course = next((e[f'{data_course}'] for e in entries
                            if f'{data_course}' in e))
             if filters:
-                filter_courses(filters, course)
+                course = filter_courses(filters, course)
 
         except StopIteration:
             return dict()
@@ -158,11 +167,37 @@ def get_one(db: TinyDB, data: dict, filters: dict):
     return course
 
 
-def get_many(db: TinyDB, data: dict(), filters: dict()):
+def get_many(db: TinyDB, data: dict(), filters: dict(),
+             cache: 'FilterCache' = None, campus: str = None,
+             generation=None):
+    """
+    This is a helper used by the `/batch` route to call get_one() for
+    every course selector in the body.
+
+    :param db: (TinyDB) Database to retrieve data from
+    :param data: (list) The course selectors from the POST body
+    :param filters: (dict) A optional dictionary of filters to be
+                    passed to filter_courses()
+    :param cache: (FilterCache) An optional cache of filtered results
+                    to read from and populate
+    :param campus: (str) Campus of `db`, used to key the cache
+    :param generation: The snapshot generation returned by
+                    FilterCache.sync(), used to key the cache
+
+    :return: ret: (list) The course listings that passed the filters
+    """
     ret = []
 
     for course in data:
-        d = get_one(db, course, filters=filters)
+        if cache is None:
+            d = get_one(db, course, filters=filters)
+        else:
+            key = cache.make_key(campus, generation, course, filters)
+            d = cache.get(key)
+            if d is None:
+                d = get_one(db, course, filters=filters)
+                if d:  # selectors that don't exist are not cached
+                    cache.put(key, d)
         if not d:  # null case from get_one (invalid param or filter)
             continue
         ret.append(d)
@@ -199,9 +234,10 @@ def filter_courses(filters: ty.Dict[str, ty.Any], course):
                             limited to (M, T, W, Th, F, S, U)
                     `time` - filter by a specified time interval
                             (8:30 AM - 9:40 PM)
-    :param course: (dict) the mutable course listing
+    :param course: (dict) the course listing, which is left untouched
 
-    :return: None
+    :return: (dict) A new course listing holding only the sections
+                    that pass the filters
     """
     # Nested functions filter courses by taking a course key and
     # returning a boolean indicating whether they should be included
@@ -263,9 +299,8 @@ def filter_courses(filters: ty.Dict[str, ty.Any], course):
         return all((status_filter(k), type_filter(k),
                    day_filter(k), time_filter(k)))
 
-    # remove each key that is evaluated false by filter_all
-    for key in itr.filterfalse(filter_all, set(course.keys())):
-        del course[key]
+    # keep each key that is evaluated true by filter_all
+    return {key: course[key] for key in filter(filter_all, course.keys())}
 
 
 def get_key(key):
@@ -285,6 +320,143 @@ def get_key(key):
     return match_obj.groups()
 
 
+def snapshot_generation(path: str) -> ty.Optional[ty.Tuple[int, int, int]]:
+    """
+    This is a helper that identifies the current snapshot of a campus
+    database. data_scraper.py replaces the database file on each run,
+    so its inode, size and modification time change with every reload.
+
+    :param path: (str) Path to the database file
+
+    :return: (tuple) The generation of the snapshot, or None if the
+                    file does not exist
+    """
+    try:
+        st = stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def canonicalize_filters(filters: ty.Dict[str, ty.Any]) -> tuple:
+    """
+    This is a helper that turns a filters dict into a hashable key.
+    Filters that select the same sections map to the same key, so
+    {'open':1, 'full':0} and {'open':True} are equivalent, and keys
+    ignored by filter_courses() are dropped.
+
+    :param filters: (dict) The filters passed to filter_courses()
+
+    :return: (tuple) The canonical form of the filters
+    """
+    if not filters:
+        return ()
+
+    key = []
+    for name in sorted(filters):
+        value = filters[name]
+        if name in ('status', 'types', 'days'):
+            key.append((name, frozenset(k for k, v in value.items() if v)))
+        elif name == 'time':
+            key.append((name, value['start'], value['end']))
+    return tuple(key)
+
+
+class FilterCache:
+    """
+    LRU cache of filtered per-course results used by the `/batch`
+    route. Entries are keyed by campus, snapshot generation, dept,
+    course and canonicalized filters, and the entries of a campus are
+    dropped whenever sync() sees a new snapshot of its database.
+
+    Cached results are shared between requests, so they must not be
+    mutated by callers.
+    """
+
+    def __init__(self, maxsize: int = BATCH_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._generations = dict()
+        self._lock = Lock()
+
+    def sync(self, campus: str, generation):
+        """
+        Record the current snapshot generation of `campus`, invalidating
+        its cached entries if the snapshot has been reloaded.
+
+        :param campus: (str) The campus that is about to be queried
+        :param generation: The value returned by snapshot_generation()
+
+        :return: The generation to pass to make_key()
+        """
+        with self._lock:
+            if self._generations.get(campus) == generation:
+                return generation
+            self._generations[campus] = generation
+            stale = [k for k in self._entries if k[0] == campus]
+            for k in stale:
+                del self._entries[k]
+            return generation
+
+    @staticmethod
+    def make_key(campus: str, generation, data: dict,
+                 filters: ty.Dict[str, ty.Any]) -> tuple:
+        """
+        :param campus: (str) The campus being queried
+        :param generation: The value returned by sync() for `campus`
+        :param data: (dict) A course selector from the POST body
+        :param filters: (dict) The filters passed to filter_courses()
+
+        :return: (tuple) The cache key of the selector
+        """
+        # Converted to str the same way get_one() does, keeping whole
+        # dept selectors (no `course`) apart from course selectors.
+        # get_one() does not filter whole depts, so neither do the keys.
+        if 'course' not in data:
+            return campus, generation, f"{data.get('dept')}", None, ()
+        return (campus, generation, f"{data.get('dept')}",
+                f"{data['course']}", canonicalize_filters(filters))
+
+    def get(self, key: tuple):
+        """
+        :param key: (tuple) A key from make_key()
+
+        :return: The cached result, or None if it is not cached
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, value) -> None:
+        """
+        :param key: (tuple) A key from make_key()
+        :param value: The result of get_one() for the key
+        """
+        with self._lock:
+            # Drop results computed against a snapshot that has since
+            # been replaced, as they can never be looked up again
+            if key[1] != self._generations.get(key[0]):
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+BATCH_CACHE = FilterCache()
+
+
 @application.route('/<campus>/list', methods=['GET'])
 def api_list(campus):
     """
@@ -358,5 +530,187 @@ def generate_url(dept: str, course: str) -> ty.Dict[str, str]:
     return {"dept": f"{dept}", "course": f"{course}"}
 
 
+@application.route('/<campus>/stats', methods=['GET'])
+def api_stats(campus):
+    """
+    `/stats` with [GET] returns aggregates of the sections of each
+    department and course: section counts by status and type, total
+    seats, waitlist seats and the range of units offered.
+    It takes an optional query parameter `dept` to return only the
+    aggregates of that department.
+
+    The aggregates are computed once per snapshot of the database and
+    looked up on each request. See get_stats() for the format.
+
+    :param campus: (str) The campus to retrieve data from
+
+    :return: 200 - Found entry and returned aggregates successfully
+                to the user.
+    :return: 404 - Could not find entry
+    """
+    if campus not in CAMPUS_LIST:
+        return 'Error! Could not find campus in database', 404
+
+    db_path = join(DB_ROOT, f'{CAMPUS_LIST[campus]}_database.json')
+    stats = STATS_CACHE.get(campus, db_path)
+
+    raw = request.args
+    qp = {k: v.upper() for k, v in raw.items()}
+
+    if 'dept' not in qp:
+        return jsonify(stats), 200
+
+    qp_dept = qp['dept']
+    if qp_dept in stats:
+        return jsonify(stats[qp_dept]), 200
+
+    return 'Error! Could not find given selectors in database', 404
+
+
+def get_stats(db: TinyDB) -> ty.Dict[str, ty.Any]:
+    """
+    This is a helper used by the `/stats` route that aggregates the
+    sections of every department and course in the database.
+
+    Example: {
+                'CS': {
+                    'sections': 12,
+                    'status': {'open': 8, 'waitlist': 2, 'full': 2,
+                               'other': 0},
+                    'types': {'standard': 7, 'online': 4, 'hybrid': 1,
+                              'other': 0},
+                    'seats': 210,
+                    'wait_seats': 95,
+                    'units': {'min': 4.5, 'max': 5.0},
+                    'courses': {'1A': {...}, ...}
+                },
+                ...
+            }
+
+    Course entries have the same format without `courses`. Sections
+    with a status other than open, waitlist or full are counted under
+    the `other` status. Sections of a type not covered by the type
+    filter, or whose course name cannot be parsed, are counted under
+    the `other` type.
+
+    :param db: (TinyDB) Database to retrieve data from
+
+    :return: (dict) The aggregates for each department
+    """
+    stats = dict()
+    for dept in db.tables():
+        dept_stats = new_stats()
+        courses = dict()
+        for entry in db.table(dept).all():
+            for course_key, course in entry.items():
+                # A dept can hold several documents with the same
+                # course key, so their sections are merged
+                course_stats = courses.setdefault(course_key, new_stats())
+                for classes in course.values():
+                    add_section(course_stats, classes[0])
+                    add_section(dept_stats, classes[0])
+
+        if not courses:
+            continue
+        dept_stats['courses'] = courses
+        stats[dept] = dept_stats
+
+    return stats
+
+
+def new_stats() -> ty.Dict[str, ty.Any]:
+    """
+    :return: (dict) Empty aggregates for get_stats()
+    """
+    return {
+        'sections': 0,
+        'status': dict({k: 0 for k in SECTION_STATUSES}, other=0),
+        'types': dict({k: 0 for k in SECTION_TYPES}, other=0),
+        'seats': 0,
+        'wait_seats': 0,
+        'units': {'min': None, 'max': None},
+    }
+
+
+def add_section(stats: ty.Dict[str, ty.Any], class_: ty.Dict[str, str]):
+    """
+    This is a helper called by get_stats() that adds a section to a set
+    of aggregates. Only the first class of a CRN is passed, as labs and
+    hybrid listings share the section's status and seats.
+
+    :param stats: (dict) The mutable aggregates from new_stats()
+    :param class_: (dict) The first class listing of the section
+
+    :return: None
+    """
+    stats['sections'] += 1
+
+    status = class_['status'].lower()
+    stats['status'][status if status in SECTION_STATUSES else 'other'] += 1
+
+    try:
+        section_type = get_key(class_['course'])[1]
+    except (AttributeError, IndexError):  # course name could not be parsed
+        type_name = 'other'
+    else:
+        type_name = next((k for k in SECTION_TYPES if section_type in
+                          (FH_TYPE_ALIAS[k], DA_TYPE_ALIAS[k])), 'other')
+    stats['types'][type_name] += 1
+
+    stats['seats'] += to_number(class_['seats'], int) or 0
+    stats['wait_seats'] += to_number(class_['wait_seats'], int) or 0
+
+    units = to_number(class_['units'], float)
+    if units is not None:
+        u = stats['units']
+        u['min'] = units if u['min'] is None else min(u['min'], units)
+        u['max'] = units if u['max'] is None else max(u['max'], units)
+
+
+def to_number(value: str, type_: ty.Callable[[str], ty.Any]):
+    """
+    :param value: (str) A numeric field from MyPortal, such as `seats`
+    :param type_: (callable) The type to convert the field to
+
+    :return: The converted field, or None if it is not a number
+    """
+    try:
+        return type_(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class StatsCache:
+    """
+    Per-campus cache of the aggregates returned by get_stats(). The
+    aggregates of a campus are recomputed only when
+    snapshot_generation() reports a new snapshot of its database.
+    """
+
+    def __init__(self):
+        self._stats = dict()
+        self._lock = Lock()
+
+    def get(self, campus: str, db_path: str) -> ty.Dict[str, ty.Any]:
+        """
+        :param campus: (str) The campus to retrieve aggregates for
+        :param db_path: (str) Path to the database of the campus
+
+        :return: (dict) The aggregates of the current snapshot
+        """
+        generation = snapshot_generation(db_path)
+        with self._lock:
+            cached = self._stats.get(campus)
+            if cached is not None and cached[0] == generation:
+                return cached[1]
+
+            stats = get_stats(TinyDB(db_path))
+            self._stats[campus] = (generation, stats)
+            return stats
+
+
+STATS_CACHE = StatsCache()
+
+
 if __name__ == '__main__':
     application.run(host='0.0.0.0', debug=True, threaded=True)
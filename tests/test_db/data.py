@@ -0,0 +1,4 @@
+test_sample_url_can_be_generated_data = {'dept': 'test_dept', 'course': 'test_course'}
+test_get_one_dept_data = [{'1A': {'40397': [{'course': 'C S F001A01Y', 'CRN': '40397', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4308', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Haight', 'seats': '26', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F001A01Y', 'CRN': '40397', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Haight', 'seats': '26', 'wait_seats': '10', 'wait_cap': '10'}], '42061': [{'course': 'C S F001A02Y', 'CRN': '42061', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Mazloom', 'seats': '31', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F001A02Y', 'CRN': '42061', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TTh', 'time': '01:30 PM-03:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4308', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Mazloom', 'seats': '31', 'wait_seats': '10', 'wait_cap': '10'}], '42062': [{'course': 'C S F001A03Y', 'CRN': '42062', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'MW', 'time': '06:00 PM-07:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5614', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '30', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F001A03Y', 'CRN': '42062', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '30', 'wait_seats': '10', 'wait_cap': '10'}], '40568': [{'course': 'C S F001A04W', 'CRN': '40568', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Cecil', 'seats': '4', 'wait_seats': '10', 'wait_cap': '10'}], '42063': [{'course': 'C S F001A05W', 'CRN': '42063', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Waitlist', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Krishnan', 'seats': '0', 'wait_seats': '7', 'wait_cap': '10'}], '42064': [{'course': 'C S F001A06W', 'CRN': '42064', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ibrahim', 'seats': '39', 'wait_seats': '10', 'wait_cap': '10'}], '42065': [{'course': 'C S F001A07W', 'CRN': '42065', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '05/21/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}]}, '1B': {'42067': [{'course': 'C S F001B01Y', 'CRN': '42067', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Open', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4308', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Mazloom', 'seats': '12', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F001B01Y', 'CRN': '42067', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Mazloom', 'seats': '12', 'wait_seats': '10', 'wait_cap': '10'}], '40400': [{'course': 'C S F001B02Y', 'CRN': '40400', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Open', 'days': 'TTh', 'time': '06:30 PM-08:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5602', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '36', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F001B02Y', 'CRN': '40400', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '36', 'wait_seats': '10', 'wait_cap': '10'}], '40856': [{'course': 'C S F001B03W', 'CRN': '40856', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Pham', 'seats': '13', 'wait_seats': '10', 'wait_cap': '10'}], '42068': [{'course': 'C S F001B04W', 'CRN': '42068', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Harden', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}], '42069': [{'course': 'C S F001B05W', 'CRN': '42069', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '12', 'wait_seats': '10', 'wait_cap': '10'}]}, '1C': {'40402': [{'course': 'C S F001C01Y', 'CRN': '40402', 'desc': 'ADV DATA STRUCT/ALGORMS JAVA', 'status': 'Open', 'days': 'MW', 'time': '01:30 PM-03:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5602', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Weusijana', 'seats': '22', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F001C01Y', 'CRN': '40402', 'desc': 'ADV DATA STRUCT/ALGORMS JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Weusijana', 'seats': '22', 'wait_seats': '10', 'wait_cap': '10'}], '40746': [{'course': 'C S F001C02W', 'CRN': '40746', 'desc': 'ADV DATA STRUCT/ALGORMS JAVA', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Mazloom', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}]}, '2A': {'40403': [{'course': 'C S F002A01Y', 'CRN': '40403', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TTh', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5609', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Venkataraman', 'seats': '23', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F002A01Y', 'CRN': '40403', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Venkataraman', 'seats': '23', 'wait_seats': '10', 'wait_cap': '10'}], '42071': [{'course': 'C S F002A02Y', 'CRN': '42071', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TTh', 'time': '06:30 PM-08:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5607', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Oluwasanmi', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F002A02Y', 'CRN': '42071', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Oluwasanmi', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}], '40405': [{'course': 'C S F002A03W', 'CRN': '40405', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Venkataraman', 'seats': '7', 'wait_seats': '10', 'wait_cap': '10'}], '40589': [{'course': 'C S F002A04W', 'CRN': '40589', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Waitlist', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Harden', 'seats': '0', 'wait_seats': '9', 'wait_cap': '10'}], '42072': [{'course': 'C S F002A05W', 'CRN': '42072', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Gentry-Kolen', 'seats': '30', 'wait_seats': '10', 'wait_cap': '10'}]}, '2B': {'40651': [{'course': 'C S F002B01Y', 'CRN': '40651', 'desc': 'INTERM SOFTWARE DESIGN C++', 'status': 'Open', 'days': 'MW', 'time': '06:30 PM-08:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5602', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Dhagat', 'seats': '35', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F002B01Y', 'CRN': '40651', 'desc': 'INTERM SOFTWARE DESIGN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Dhagat', 'seats': '35', 'wait_seats': '10', 'wait_cap': '10'}], '40406': [{'course': 'C S F002B02W', 'CRN': '40406', 'desc': 'INTERM SOFTWARE DESIGN C++', 'status': 'Waitlist', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Harden', 'seats': '0', 'wait_seats': '4', 'wait_cap': '10'}], '41360': [{'course': 'C S F002B03W', 'CRN': '41360', 'desc': 'INTERM SOFTWARE DESIGN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Pham', 'seats': '34', 'wait_seats': '10', 'wait_cap': '10'}], '42112': [{'course': 'C S F002B04Y', 'CRN': '42112', 'desc': 'INTERM SOFTWARE DESIGN C++', 'status': 'Open', 'days': 'MW', 'time': '01:30 PM-03:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5610', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lankester', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F002B04Y', 'CRN': '42112', 'desc': 'INTERM SOFTWARE DESIGN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lankester', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}]}, '2C': {'40407': [{'course': 'C S F002C01Y', 'CRN': '40407', 'desc': 'ADV DATA  STRUCT/ALGRM IN C++', 'status': 'Open', 'days': 'TTh', 'time': '01:30 PM-03:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5607', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lankester', 'seats': '17', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F002C01Y', 'CRN': '40407', 'desc': 'ADV DATA  STRUCT/ALGRM IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lankester', 'seats': '17', 'wait_seats': '10', 'wait_cap': '10'}], '40754': [{'course': 'C S F002C02W', 'CRN': '40754', 'desc': 'ADV DATA  STRUCT/ALGRM IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Venkataraman', 'seats': '3', 'wait_seats': '10', 'wait_cap': '10'}]}, '3A': {'42073': [{'course': 'C S F003A01Y', 'CRN': '42073', 'desc': 'OBJECT ORIEN PRGM METH PYTHON', 'status': 'Open', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4306', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Haight', 'seats': '28', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F003A01Y', 'CRN': '42073', 'desc': 'OBJECT ORIEN PRGM METH PYTHON', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Haight', 'seats': '28', 'wait_seats': '10', 'wait_cap': '10'}], '42074': [{'course': 'C S F003A02W', 'CRN': '42074', 'desc': 'OBJECT ORIEN PRGM METH PYTHON', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lai', 'seats': '2', 'wait_seats': '10', 'wait_cap': '10'}], '42075': [{'course': 'C S F003A03W', 'CRN': '42075', 'desc': 'OBJECT ORIEN PRGM METH PYTHON', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Xiong', 'seats': '29', 'wait_seats': '10', 'wait_cap': '10'}], '42076': [{'course': 'C S F003A04W', 'CRN': '42076', 'desc': 'OBJECT ORIEN PRGM METH PYTHON', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lai', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}], '42077': [{'course': 'C S F003A05W', 'CRN': '42077', 'desc': 'OBJECT ORIEN PRGM METH PYTHON', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '05/21/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}]}, '10': {'40408': [{'course': 'C S F010.01Y', 'CRN': '40408', 'desc': 'COMPUTER ARCHITEC/ORGANIZATION', 'status': 'Open', 'days': 'TTh', 'time': '06:30 PM-08:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5610', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Riordan', 'seats': '15', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F010.01Y', 'CRN': '40408', 'desc': 'COMPUTER ARCHITEC/ORGANIZATION', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Riordan', 'seats': '15', 'wait_seats': '10', 'wait_cap': '10'}], '40890': [{'course': 'C S F010.02W', 'CRN': '40890', 'desc': 'COMPUTER ARCHITEC/ORGANIZATION', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lamble', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}]}, '18': {'41406': [{'course': 'C S F018.01', 'CRN': '41406', 'desc': 'DISCRETE MATHEMATICS', 'status': 'Full', 'days': 'MW', 'time': '01:30 PM-03:45 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4502', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Morriss', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}], '41407': [{'course': 'C S F018.02', 'CRN': '41407', 'desc': 'DISCRETE MATHEMATICS', 'status': 'Full', 'days': 'MW', 'time': '06:00 PM-08:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Witschorik', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}]}, '20A': {'42127': [{'course': 'C S F020A01W', 'CRN': '42127', 'desc': 'PROGRAMMING IN C#', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Meade', 'seats': '23', 'wait_seats': '10', 'wait_cap': '10'}]}, '21A': {'42090': [{'course': 'C S F021A01Y', 'CRN': '42090', 'desc': 'PYTHON FOR PROGRAMMERS', 'status': 'Open', 'days': 'TTh', 'time': '06:30 PM-08:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5609', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Van Der Linden', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F021A01Y', 'CRN': '42090', 'desc': 'PYTHON FOR PROGRAMMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Van Der Linden', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}], '40597': [{'course': 'C S F021A02W', 'CRN': '40597', 'desc': 'PYTHON FOR PROGRAMMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Khayrallah', 'seats': '2', 'wait_seats': '10', 'wait_cap': '10'}], '41543': [{'course': 'C S F021A03W', 'CRN': '41543', 'desc': 'PYTHON FOR PROGRAMMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Xiong', 'seats': '38', 'wait_seats': '10', 'wait_cap': '10'}], '42091': [{'course': 'C S F021A04W', 'CRN': '42091', 'desc': 'PYTHON FOR PROGRAMMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Cecil', 'seats': '34', 'wait_seats': '10', 'wait_cap': '10'}]}, '21B': {'42093': [{'course': 'C S F021B02W', 'CRN': '42093', 'desc': 'INTRM PYTHON PROGRAMMING', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lamble', 'seats': '4', 'wait_seats': '10', 'wait_cap': '10'}]}, '22A': {'40571': [{'course': 'C S F022A01W', 'CRN': '40571', 'desc': 'JAVASCRIPT FOR PROGRAMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '39', 'wait_seats': '10', 'wait_cap': '10'}], '42128': [{'course': 'C S F022A02W', 'CRN': '42128', 'desc': 'JAVASCRIPT FOR PROGRAMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Meade', 'seats': '11', 'wait_seats': '10', 'wait_cap': '10'}], '42133': [{'course': 'C S F022A03W', 'CRN': '42133', 'desc': 'JAVASCRIPT FOR PROGRAMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Weusijana', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}]}, '30A': {'40572': [{'course': 'C S F030A01W', 'CRN': '40572', 'desc': 'INTRODUCTION TO LINUX', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '13', 'wait_seats': '10', 'wait_cap': '10'}]}, '30B': {'41311': [{'course': 'C S F030B01W', 'CRN': '41311', 'desc': 'LINUX SHELL PROGRAMMING', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '30', 'wait_seats': '10', 'wait_cap': '10'}]}, '31A': {'40654': [{'course': 'C S F031A01W', 'CRN': '40654', 'desc': 'INTRO DATABASE MGMT SYSTEMS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ibrahim', 'seats': '17', 'wait_seats': '10', 'wait_cap': '10'}]}, '49': {'42094': [{'course': 'C S F049.01Y', 'CRN': '42094', 'desc': 'FOUNDATIONS OF COMPUTER PROGRA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  2.00', 'instructor': 'Barnard', 'seats': '31', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F049.01Y', 'CRN': '42094', 'desc': 'FOUNDATIONS OF COMPUTER PROGRA', 'status': 'Open', 'days': 'W', 'time': '01:30 PM-03:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4302', 'campus': 'FH', 'units': '  2.00', 'instructor': 'Barnard', 'seats': '31', 'wait_seats': '10', 'wait_cap': '10'}], '40891': [{'course': 'C S F049.02W', 'CRN': '40891', 'desc': 'FOUNDATIONS OF COMPUTER PROGRA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  2.00', 'instructor': 'Agarwal', 'seats': '16', 'wait_seats': '10', 'wait_cap': '10'}]}, '50A': {'40410': [{'course': 'C S F050A01Y', 'CRN': '40410', 'desc': 'NETWORK BASICS (CCNA)', 'status': 'Open', 'days': 'T', 'time': '06:00 PM-09:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4308', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '34', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F050A01Y', 'CRN': '40410', 'desc': 'NETWORK BASICS (CCNA)', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '34', 'wait_seats': '10', 'wait_cap': '10'}]}, '50C': {'42095': [{'course': 'C S F050C01Y', 'CRN': '42095', 'desc': 'SCALING LOCAL AREA NTWR (CCNA)', 'status': 'Open', 'days': 'M', 'time': '06:00 PM-09:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4308', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '36', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F050C01Y', 'CRN': '42095', 'desc': 'SCALING LOCAL AREA NTWR (CCNA)', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '36', 'wait_seats': '10', 'wait_cap': '10'}], '42115': [{'course': 'C S F050C02W', 'CRN': '42115', 'desc': 'SCALING LOCAL AREA NTWR (CCNA)', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '36', 'wait_seats': '10', 'wait_cap': '10'}]}, '50E': {'41312': [{'course': 'C S F050E01Y', 'CRN': '41312', 'desc': 'INTRO TO IP NETWORK SECURITY', 'status': 'Open', 'days': 'W', 'time': '06:00 PM-09:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4308', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '38', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F050E01Y', 'CRN': '41312', 'desc': 'INTRO TO IP NETWORK SECURITY', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '38', 'wait_seats': '10', 'wait_cap': '10'}]}, '53A': {'42116': [{'course': 'C S F053A01Y', 'CRN': '42116', 'desc': 'CYBERSECURITY FUNDAMENTALS', 'status': 'Open', 'days': 'M', 'time': '06:00 PM-09:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4306', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ryan', 'seats': '39', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F053A01Y', 'CRN': '42116', 'desc': 'CYBERSECURITY FUNDAMENTALS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ryan', 'seats': '39', 'wait_seats': '10', 'wait_cap': '10'}], '42117': [{'course': 'C S F053A02W', 'CRN': '42117', 'desc': 'CYBERSECURITY FUNDAMENTALS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ryan', 'seats': '22', 'wait_seats': '10', 'wait_cap': '10'}]}, '53B': {'42118': [{'course': 'C S F053B01Y', 'CRN': '42118', 'desc': 'FIREWALLS & THREAT MANAGEMENT', 'status': 'Open', 'days': 'W', 'time': '06:00 PM-09:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5609', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ryan', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F053B01Y', 'CRN': '42118', 'desc': 'FIREWALLS & THREAT MANAGEMENT', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ryan', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}], '42119': [{'course': 'C S F053B02W', 'CRN': '42119', 'desc': 'FIREWALLS & THREAT MANAGEMENT', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ryan', 'seats': '33', 'wait_seats': '10', 'wait_cap': '10'}]}, '60A': {'42120': [{'course': 'C S F060A01Y', 'CRN': '42120', 'desc': 'INSTALL/CONFIRG WINDOW SERVR 1', 'status': 'Open', 'days': 'W', 'time': '06:00 PM-09:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4306', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '35', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F060A01Y', 'CRN': '42120', 'desc': 'INSTALL/CONFIRG WINDOW SERVR 1', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '35', 'wait_seats': '10', 'wait_cap': '10'}]}, '63A': {'42121': [{'course': 'C S F063A01W', 'CRN': '42121', 'desc': 'DEVELOPING APPLICATION FOR IOS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Gentry-Kolen', 'seats': '27', 'wait_seats': '10', 'wait_cap': '10'}]}, '80A': {'42122': [{'course': 'C S F080A01W', 'CRN': '42122', 'desc': 'OPEN SOURCE CONTRIBUTION', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Kosar', 'seats': '29', 'wait_seats': '10', 'wait_cap': '10'}]}, '81A': {'42123': [{'course': 'C S F081A01W', 'CRN': '42123', 'desc': '3-D GRAPHICS PROGRAMMING', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Trinh', 'seats': '28', 'wait_seats': '10', 'wait_cap': '10'}]}, '82A': {'40662': [{'course': 'C S F082A50Y', 'CRN': '40662', 'desc': 'INTRO SOFTWARE QUALITY ASSURAN', 'status': 'Open', 'days': 'S', 'time': '09:00 AM-12:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'SV222', 'campus': 'FC', 'units': '  4.50', 'instructor': 'Staff', 'seats': '35', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F082A50Y', 'CRN': '40662', 'desc': 'INTRO SOFTWARE QUALITY ASSURAN', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FC', 'units': '  4.50', 'instructor': 'Staff', 'seats': '35', 'wait_seats': '10', 'wait_cap': '10'}]}}]
+test_get_one_dept_and_course_data = {'40403': [{'course': 'C S F002A01Y', 'CRN': '40403', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TTh', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5609', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Venkataraman', 'seats': '23', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F002A01Y', 'CRN': '40403', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Venkataraman', 'seats': '23', 'wait_seats': '10', 'wait_cap': '10'}], '42071': [{'course': 'C S F002A02Y', 'CRN': '42071', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TTh', 'time': '06:30 PM-08:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5607', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Oluwasanmi', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F002A02Y', 'CRN': '42071', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Oluwasanmi', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}], '40405': [{'course': 'C S F002A03W', 'CRN': '40405', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Venkataraman', 'seats': '7', 'wait_seats': '10', 'wait_cap': '10'}], '40589': [{'course': 'C S F002A04W', 'CRN': '40589', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Waitlist', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Harden', 'seats': '0', 'wait_seats': '9', 'wait_cap': '10'}], '42072': [{'course': 'C S F002A05W', 'CRN': '42072', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Gentry-Kolen', 'seats': '30', 'wait_seats': '10', 'wait_cap': '10'}]}
+test_get_two_dept_data = [[{'1A': {'40397': [{'course': 'C S F001A01Y', 'CRN': '40397', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4308', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Haight', 'seats': '26', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F001A01Y', 'CRN': '40397', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Haight', 'seats': '26', 'wait_seats': '10', 'wait_cap': '10'}], '42061': [{'course': 'C S F001A02Y', 'CRN': '42061', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Mazloom', 'seats': '31', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F001A02Y', 'CRN': '42061', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TTh', 'time': '01:30 PM-03:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4308', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Mazloom', 'seats': '31', 'wait_seats': '10', 'wait_cap': '10'}], '42062': [{'course': 'C S F001A03Y', 'CRN': '42062', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'MW', 'time': '06:00 PM-07:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5614', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '30', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F001A03Y', 'CRN': '42062', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '30', 'wait_seats': '10', 'wait_cap': '10'}], '40568': [{'course': 'C S F001A04W', 'CRN': '40568', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Cecil', 'seats': '4', 'wait_seats': '10', 'wait_cap': '10'}], '42063': [{'course': 'C S F001A05W', 'CRN': '42063', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Waitlist', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Krishnan', 'seats': '0', 'wait_seats': '7', 'wait_cap': '10'}], '42064': [{'course': 'C S F001A06W', 'CRN': '42064', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ibrahim', 'seats': '39', 'wait_seats': '10', 'wait_cap': '10'}], '42065': [{'course': 'C S F001A07W', 'CRN': '42065', 'desc': 'OBJ-ORIENTED PROG METHOD JAVA', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '05/21/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}]}, '1B': {'42067': [{'course': 'C S F001B01Y', 'CRN': '42067', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Open', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4308', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Mazloom', 'seats': '12', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F001B01Y', 'CRN': '42067', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Mazloom', 'seats': '12', 'wait_seats': '10', 'wait_cap': '10'}], '40400': [{'course': 'C S F001B02Y', 'CRN': '40400', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Open', 'days': 'TTh', 'time': '06:30 PM-08:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5602', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '36', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F001B02Y', 'CRN': '40400', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '36', 'wait_seats': '10', 'wait_cap': '10'}], '40856': [{'course': 'C S F001B03W', 'CRN': '40856', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Pham', 'seats': '13', 'wait_seats': '10', 'wait_cap': '10'}], '42068': [{'course': 'C S F001B04W', 'CRN': '42068', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Harden', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}], '42069': [{'course': 'C S F001B05W', 'CRN': '42069', 'desc': 'INTERM SOFTWARE DESIGN IN JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '12', 'wait_seats': '10', 'wait_cap': '10'}]}, '1C': {'40402': [{'course': 'C S F001C01Y', 'CRN': '40402', 'desc': 'ADV DATA STRUCT/ALGORMS JAVA', 'status': 'Open', 'days': 'MW', 'time': '01:30 PM-03:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5602', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Weusijana', 'seats': '22', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F001C01Y', 'CRN': '40402', 'desc': 'ADV DATA STRUCT/ALGORMS JAVA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Weusijana', 'seats': '22', 'wait_seats': '10', 'wait_cap': '10'}], '40746': [{'course': 'C S F001C02W', 'CRN': '40746', 'desc': 'ADV DATA STRUCT/ALGORMS JAVA', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Mazloom', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}]}, '2A': {'40403': [{'course': 'C S F002A01Y', 'CRN': '40403', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TTh', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5609', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Venkataraman', 'seats': '23', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F002A01Y', 'CRN': '40403', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Venkataraman', 'seats': '23', 'wait_seats': '10', 'wait_cap': '10'}], '42071': [{'course': 'C S F002A02Y', 'CRN': '42071', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TTh', 'time': '06:30 PM-08:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5607', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Oluwasanmi', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F002A02Y', 'CRN': '42071', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Oluwasanmi', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}], '40405': [{'course': 'C S F002A03W', 'CRN': '40405', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Venkataraman', 'seats': '7', 'wait_seats': '10', 'wait_cap': '10'}], '40589': [{'course': 'C S F002A04W', 'CRN': '40589', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Waitlist', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Harden', 'seats': '0', 'wait_seats': '9', 'wait_cap': '10'}], '42072': [{'course': 'C S F002A05W', 'CRN': '42072', 'desc': 'OBJ-ORIENT PROG METHOD IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Gentry-Kolen', 'seats': '30', 'wait_seats': '10', 'wait_cap': '10'}]}, '2B': {'40651': [{'course': 'C S F002B01Y', 'CRN': '40651', 'desc': 'INTERM SOFTWARE DESIGN C++', 'status': 'Open', 'days': 'MW', 'time': '06:30 PM-08:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5602', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Dhagat', 'seats': '35', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F002B01Y', 'CRN': '40651', 'desc': 'INTERM SOFTWARE DESIGN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Dhagat', 'seats': '35', 'wait_seats': '10', 'wait_cap': '10'}], '40406': [{'course': 'C S F002B02W', 'CRN': '40406', 'desc': 'INTERM SOFTWARE DESIGN C++', 'status': 'Waitlist', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Harden', 'seats': '0', 'wait_seats': '4', 'wait_cap': '10'}], '41360': [{'course': 'C S F002B03W', 'CRN': '41360', 'desc': 'INTERM SOFTWARE DESIGN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Pham', 'seats': '34', 'wait_seats': '10', 'wait_cap': '10'}], '42112': [{'course': 'C S F002B04Y', 'CRN': '42112', 'desc': 'INTERM SOFTWARE DESIGN C++', 'status': 'Open', 'days': 'MW', 'time': '01:30 PM-03:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5610', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lankester', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F002B04Y', 'CRN': '42112', 'desc': 'INTERM SOFTWARE DESIGN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lankester', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}]}, '2C': {'40407': [{'course': 'C S F002C01Y', 'CRN': '40407', 'desc': 'ADV DATA  STRUCT/ALGRM IN C++', 'status': 'Open', 'days': 'TTh', 'time': '01:30 PM-03:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5607', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lankester', 'seats': '17', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F002C01Y', 'CRN': '40407', 'desc': 'ADV DATA  STRUCT/ALGRM IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lankester', 'seats': '17', 'wait_seats': '10', 'wait_cap': '10'}], '40754': [{'course': 'C S F002C02W', 'CRN': '40754', 'desc': 'ADV DATA  STRUCT/ALGRM IN C++', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Venkataraman', 'seats': '3', 'wait_seats': '10', 'wait_cap': '10'}]}, '3A': {'42073': [{'course': 'C S F003A01Y', 'CRN': '42073', 'desc': 'OBJECT ORIEN PRGM METH PYTHON', 'status': 'Open', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4306', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Haight', 'seats': '28', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F003A01Y', 'CRN': '42073', 'desc': 'OBJECT ORIEN PRGM METH PYTHON', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Haight', 'seats': '28', 'wait_seats': '10', 'wait_cap': '10'}], '42074': [{'course': 'C S F003A02W', 'CRN': '42074', 'desc': 'OBJECT ORIEN PRGM METH PYTHON', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lai', 'seats': '2', 'wait_seats': '10', 'wait_cap': '10'}], '42075': [{'course': 'C S F003A03W', 'CRN': '42075', 'desc': 'OBJECT ORIEN PRGM METH PYTHON', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Xiong', 'seats': '29', 'wait_seats': '10', 'wait_cap': '10'}], '42076': [{'course': 'C S F003A04W', 'CRN': '42076', 'desc': 'OBJECT ORIEN PRGM METH PYTHON', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lai', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}], '42077': [{'course': 'C S F003A05W', 'CRN': '42077', 'desc': 'OBJECT ORIEN PRGM METH PYTHON', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '05/21/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}]}, '10': {'40408': [{'course': 'C S F010.01Y', 'CRN': '40408', 'desc': 'COMPUTER ARCHITEC/ORGANIZATION', 'status': 'Open', 'days': 'TTh', 'time': '06:30 PM-08:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5610', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Riordan', 'seats': '15', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F010.01Y', 'CRN': '40408', 'desc': 'COMPUTER ARCHITEC/ORGANIZATION', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Riordan', 'seats': '15', 'wait_seats': '10', 'wait_cap': '10'}], '40890': [{'course': 'C S F010.02W', 'CRN': '40890', 'desc': 'COMPUTER ARCHITEC/ORGANIZATION', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lamble', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}]}, '18': {'41406': [{'course': 'C S F018.01', 'CRN': '41406', 'desc': 'DISCRETE MATHEMATICS', 'status': 'Full', 'days': 'MW', 'time': '01:30 PM-03:45 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4502', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Morriss', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}], '41407': [{'course': 'C S F018.02', 'CRN': '41407', 'desc': 'DISCRETE MATHEMATICS', 'status': 'Full', 'days': 'MW', 'time': '06:00 PM-08:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Witschorik', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}]}, '20A': {'42127': [{'course': 'C S F020A01W', 'CRN': '42127', 'desc': 'PROGRAMMING IN C#', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Meade', 'seats': '23', 'wait_seats': '10', 'wait_cap': '10'}]}, '21A': {'42090': [{'course': 'C S F021A01Y', 'CRN': '42090', 'desc': 'PYTHON FOR PROGRAMMERS', 'status': 'Open', 'days': 'TTh', 'time': '06:30 PM-08:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5609', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Van Der Linden', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F021A01Y', 'CRN': '42090', 'desc': 'PYTHON FOR PROGRAMMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Van Der Linden', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}], '40597': [{'course': 'C S F021A02W', 'CRN': '40597', 'desc': 'PYTHON FOR PROGRAMMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Khayrallah', 'seats': '2', 'wait_seats': '10', 'wait_cap': '10'}], '41543': [{'course': 'C S F021A03W', 'CRN': '41543', 'desc': 'PYTHON FOR PROGRAMMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Xiong', 'seats': '38', 'wait_seats': '10', 'wait_cap': '10'}], '42091': [{'course': 'C S F021A04W', 'CRN': '42091', 'desc': 'PYTHON FOR PROGRAMMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Cecil', 'seats': '34', 'wait_seats': '10', 'wait_cap': '10'}]}, '21B': {'42093': [{'course': 'C S F021B02W', 'CRN': '42093', 'desc': 'INTRM PYTHON PROGRAMMING', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Lamble', 'seats': '4', 'wait_seats': '10', 'wait_cap': '10'}]}, '22A': {'40571': [{'course': 'C S F022A01W', 'CRN': '40571', 'desc': 'JAVASCRIPT FOR PROGRAMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '39', 'wait_seats': '10', 'wait_cap': '10'}], '42128': [{'course': 'C S F022A02W', 'CRN': '42128', 'desc': 'JAVASCRIPT FOR PROGRAMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Meade', 'seats': '11', 'wait_seats': '10', 'wait_cap': '10'}], '42133': [{'course': 'C S F022A03W', 'CRN': '42133', 'desc': 'JAVASCRIPT FOR PROGRAMERS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Weusijana', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}]}, '30A': {'40572': [{'course': 'C S F030A01W', 'CRN': '40572', 'desc': 'INTRODUCTION TO LINUX', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '13', 'wait_seats': '10', 'wait_cap': '10'}]}, '30B': {'41311': [{'course': 'C S F030B01W', 'CRN': '41311', 'desc': 'LINUX SHELL PROGRAMMING', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '30', 'wait_seats': '10', 'wait_cap': '10'}]}, '31A': {'40654': [{'course': 'C S F031A01W', 'CRN': '40654', 'desc': 'INTRO DATABASE MGMT SYSTEMS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ibrahim', 'seats': '17', 'wait_seats': '10', 'wait_cap': '10'}]}, '49': {'42094': [{'course': 'C S F049.01Y', 'CRN': '42094', 'desc': 'FOUNDATIONS OF COMPUTER PROGRA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  2.00', 'instructor': 'Barnard', 'seats': '31', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F049.01Y', 'CRN': '42094', 'desc': 'FOUNDATIONS OF COMPUTER PROGRA', 'status': 'Open', 'days': 'W', 'time': '01:30 PM-03:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4302', 'campus': 'FH', 'units': '  2.00', 'instructor': 'Barnard', 'seats': '31', 'wait_seats': '10', 'wait_cap': '10'}], '40891': [{'course': 'C S F049.02W', 'CRN': '40891', 'desc': 'FOUNDATIONS OF COMPUTER PROGRA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  2.00', 'instructor': 'Agarwal', 'seats': '16', 'wait_seats': '10', 'wait_cap': '10'}]}, '50A': {'40410': [{'course': 'C S F050A01Y', 'CRN': '40410', 'desc': 'NETWORK BASICS (CCNA)', 'status': 'Open', 'days': 'T', 'time': '06:00 PM-09:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4308', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '34', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F050A01Y', 'CRN': '40410', 'desc': 'NETWORK BASICS (CCNA)', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '34', 'wait_seats': '10', 'wait_cap': '10'}]}, '50C': {'42095': [{'course': 'C S F050C01Y', 'CRN': '42095', 'desc': 'SCALING LOCAL AREA NTWR (CCNA)', 'status': 'Open', 'days': 'M', 'time': '06:00 PM-09:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4308', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '36', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F050C01Y', 'CRN': '42095', 'desc': 'SCALING LOCAL AREA NTWR (CCNA)', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '36', 'wait_seats': '10', 'wait_cap': '10'}], '42115': [{'course': 'C S F050C02W', 'CRN': '42115', 'desc': 'SCALING LOCAL AREA NTWR (CCNA)', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Murphy', 'seats': '36', 'wait_seats': '10', 'wait_cap': '10'}]}, '50E': {'41312': [{'course': 'C S F050E01Y', 'CRN': '41312', 'desc': 'INTRO TO IP NETWORK SECURITY', 'status': 'Open', 'days': 'W', 'time': '06:00 PM-09:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4308', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '38', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F050E01Y', 'CRN': '41312', 'desc': 'INTRO TO IP NETWORK SECURITY', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '38', 'wait_seats': '10', 'wait_cap': '10'}]}, '53A': {'42116': [{'course': 'C S F053A01Y', 'CRN': '42116', 'desc': 'CYBERSECURITY FUNDAMENTALS', 'status': 'Open', 'days': 'M', 'time': '06:00 PM-09:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4306', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ryan', 'seats': '39', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F053A01Y', 'CRN': '42116', 'desc': 'CYBERSECURITY FUNDAMENTALS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ryan', 'seats': '39', 'wait_seats': '10', 'wait_cap': '10'}], '42117': [{'course': 'C S F053A02W', 'CRN': '42117', 'desc': 'CYBERSECURITY FUNDAMENTALS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ryan', 'seats': '22', 'wait_seats': '10', 'wait_cap': '10'}]}, '53B': {'42118': [{'course': 'C S F053B01Y', 'CRN': '42118', 'desc': 'FIREWALLS & THREAT MANAGEMENT', 'status': 'Open', 'days': 'W', 'time': '06:00 PM-09:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5609', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ryan', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F053B01Y', 'CRN': '42118', 'desc': 'FIREWALLS & THREAT MANAGEMENT', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ryan', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}], '42119': [{'course': 'C S F053B02W', 'CRN': '42119', 'desc': 'FIREWALLS & THREAT MANAGEMENT', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Ryan', 'seats': '33', 'wait_seats': '10', 'wait_cap': '10'}]}, '60A': {'42120': [{'course': 'C S F060A01Y', 'CRN': '42120', 'desc': 'INSTALL/CONFIRG WINDOW SERVR 1', 'status': 'Open', 'days': 'W', 'time': '06:00 PM-09:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4306', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '35', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F060A01Y', 'CRN': '42120', 'desc': 'INSTALL/CONFIRG WINDOW SERVR 1', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Staff', 'seats': '35', 'wait_seats': '10', 'wait_cap': '10'}]}, '63A': {'42121': [{'course': 'C S F063A01W', 'CRN': '42121', 'desc': 'DEVELOPING APPLICATION FOR IOS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Gentry-Kolen', 'seats': '27', 'wait_seats': '10', 'wait_cap': '10'}]}, '80A': {'42122': [{'course': 'C S F080A01W', 'CRN': '42122', 'desc': 'OPEN SOURCE CONTRIBUTION', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Kosar', 'seats': '29', 'wait_seats': '10', 'wait_cap': '10'}]}, '81A': {'42123': [{'course': 'C S F081A01W', 'CRN': '42123', 'desc': '3-D GRAPHICS PROGRAMMING', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  4.50', 'instructor': 'Trinh', 'seats': '28', 'wait_seats': '10', 'wait_cap': '10'}]}, '82A': {'40662': [{'course': 'C S F082A50Y', 'CRN': '40662', 'desc': 'INTRO SOFTWARE QUALITY ASSURAN', 'status': 'Open', 'days': 'S', 'time': '09:00 AM-12:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'SV222', 'campus': 'FC', 'units': '  4.50', 'instructor': 'Staff', 'seats': '35', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'C S F082A50Y', 'CRN': '40662', 'desc': 'INTRO SOFTWARE QUALITY ASSURAN', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FC', 'units': '  4.50', 'instructor': 'Staff', 'seats': '35', 'wait_seats': '10', 'wait_cap': '10'}]}}], [{'1A': {'40142': [{'course': 'MATH F001A02', 'CRN': '40142', 'desc': 'CALCULUS', 'status': 'Waitlist', 'days': 'TTh', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4604', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Litrus', 'seats': '0', 'wait_seats': '1', 'wait_cap': '10'}, {'course': 'MATH F001A02', 'CRN': '40142', 'desc': 'CALCULUS', 'status': 'Waitlist', 'days': 'F', 'time': '09:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4604', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Litrus', 'seats': '0', 'wait_seats': '1', 'wait_cap': '10'}], '40143': [{'course': 'MATH F001A03', 'CRN': '40143', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Knobel', 'seats': '24', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F001A03', 'CRN': '40143', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'F', 'time': '10:00 AM-10:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Knobel', 'seats': '24', 'wait_seats': '10', 'wait_cap': '10'}], '40369': [{'course': 'MATH F001A04', 'CRN': '40369', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Lee', 'seats': '2', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F001A04', 'CRN': '40369', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'F', 'time': '11:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Lee', 'seats': '2', 'wait_seats': '10', 'wait_cap': '10'}], '40893': [{'course': 'MATH F001A06', 'CRN': '40893', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'MW', 'time': '01:30 PM-03:45 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4605', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Knobel', 'seats': '26', 'wait_seats': '10', 'wait_cap': '10'}], '41852': [{'course': 'MATH F001A07W', 'CRN': '41852', 'desc': 'CALCULUS', 'status': 'Waitlist', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Williams', 'seats': '0', 'wait_seats': '5', 'wait_cap': '10'}], '42059': [{'course': 'MATH F001A08W', 'CRN': '42059', 'desc': 'CALCULUS', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '05/21/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Williams', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}]}, '1B': {'40144': [{'course': 'MATH F001B01', 'CRN': '40144', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'TTh', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Lee', 'seats': '2', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F001B01', 'CRN': '40144', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'F', 'time': '09:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Lee', 'seats': '2', 'wait_seats': '10', 'wait_cap': '10'}], '40495': [{'course': 'MATH F001B02', 'CRN': '40495', 'desc': 'CALCULUS', 'status': 'Full', 'days': 'F', 'time': '10:00 AM-10:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Nghiem', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}, {'course': 'MATH F001B02', 'CRN': '40495', 'desc': 'CALCULUS', 'status': 'Full', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Nghiem', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}], '40145': [{'course': 'MATH F001B03', 'CRN': '40145', 'desc': 'CALCULUS', 'status': 'Waitlist', 'days': 'F', 'time': '11:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4605', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Nghiem', 'seats': '0', 'wait_seats': '1', 'wait_cap': '10'}, {'course': 'MATH F001B03', 'CRN': '40145', 'desc': 'CALCULUS', 'status': 'Waitlist', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4605', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Nghiem', 'seats': '0', 'wait_seats': '1', 'wait_cap': '10'}], '42054': [{'course': 'MATH F001B04W', 'CRN': '42054', 'desc': 'CALCULUS', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Williams', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}], '40370': [{'course': 'MATH F001B05', 'CRN': '40370', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'TTh', 'time': '06:30 PM-08:45 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'SV220', 'campus': 'FC', 'units': '  5.00', 'instructor': 'Florero Salinas', 'seats': '19', 'wait_seats': '10', 'wait_cap': '10'}]}, '1C': {'40147': [{'course': 'MATH F001C01', 'CRN': '40147', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'TTh', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4602', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Anderson', 'seats': '24', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F001C01', 'CRN': '40147', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'F', 'time': '09:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4602', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Anderson', 'seats': '24', 'wait_seats': '10', 'wait_cap': '10'}], '40148': [{'course': 'MATH F001C02', 'CRN': '40148', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4605', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Cembellin', 'seats': '8', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F001C02', 'CRN': '40148', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'F', 'time': '10:00 AM-10:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4605', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Cembellin', 'seats': '8', 'wait_seats': '10', 'wait_cap': '10'}], '40149': [{'course': 'MATH F001C03', 'CRN': '40149', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4602', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Cembellin', 'seats': '10', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F001C03', 'CRN': '40149', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'F', 'time': '11:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4602', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Cembellin', 'seats': '10', 'wait_seats': '10', 'wait_cap': '10'}], '40516': [{'course': 'MATH F001C04', 'CRN': '40516', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'TThF', 'time': '12:00 PM-01:25 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Park Lee', 'seats': '7', 'wait_seats': '10', 'wait_cap': '10'}], '40517': [{'course': 'MATH F001C05', 'CRN': '40517', 'desc': 'CALCULUS', 'status': 'Waitlist', 'days': 'TTh', 'time': '06:00 PM-08:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4602', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Nosratieh', 'seats': '0', 'wait_seats': '7', 'wait_cap': '10'}]}, '1D': {'40150': [{'course': 'MATH F001D01', 'CRN': '40150', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4604', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Park Lee', 'seats': '25', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F001D01', 'CRN': '40150', 'desc': 'CALCULUS', 'status': 'Open', 'days': 'F', 'time': '10:00 AM-10:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4604', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Park Lee', 'seats': '25', 'wait_seats': '10', 'wait_cap': '10'}], '40454': [{'course': 'MATH F001D02', 'CRN': '40454', 'desc': 'CALCULUS', 'status': 'Full', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Lublin', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}, {'course': 'MATH F001D02', 'CRN': '40454', 'desc': 'CALCULUS', 'status': 'Full', 'days': 'F', 'time': '11:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Lublin', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}], '40950': [{'course': 'MATH F001D03', 'CRN': '40950', 'desc': 'CALCULUS', 'status': 'Full', 'days': 'MW', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4603', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Reese', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}, {'course': 'MATH F001D03', 'CRN': '40950', 'desc': 'CALCULUS', 'status': 'Full', 'days': 'F', 'time': '08:00 AM-08:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4603', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Reese', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}]}, '2A': {'40151': [{'course': 'MATH F002A01', 'CRN': '40151', 'desc': 'DIFFERENTIAL EQUATIONS', 'status': 'Open', 'days': 'MW', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Park Lee', 'seats': '21', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F002A01', 'CRN': '40151', 'desc': 'DIFFERENTIAL EQUATIONS', 'status': 'Open', 'days': 'F', 'time': '08:00 AM-08:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Park Lee', 'seats': '21', 'wait_seats': '10', 'wait_cap': '10'}], '40433': [{'course': 'MATH F002A02', 'CRN': '40433', 'desc': 'DIFFERENTIAL EQUATIONS', 'status': 'Open', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5610', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Park Lee', 'seats': '10', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F002A02', 'CRN': '40433', 'desc': 'DIFFERENTIAL EQUATIONS', 'status': 'Open', 'days': 'F', 'time': '11:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5610', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Park Lee', 'seats': '10', 'wait_seats': '10', 'wait_cap': '10'}], '40518': [{'course': 'MATH F002A03', 'CRN': '40518', 'desc': 'DIFFERENTIAL EQUATIONS', 'status': 'Open', 'days': 'MW', 'time': '06:00 PM-08:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4603', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Park Lee', 'seats': '10', 'wait_seats': '10', 'wait_cap': '10'}]}, '2B': {'40372': [{'course': 'MATH F002B01', 'CRN': '40372', 'desc': 'LINEAR ALGEBRA', 'status': 'Open', 'days': 'MW', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4604', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Lee', 'seats': '8', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F002B01', 'CRN': '40372', 'desc': 'LINEAR ALGEBRA', 'status': 'Open', 'days': 'F', 'time': '08:00 AM-08:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4604', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Lee', 'seats': '8', 'wait_seats': '10', 'wait_cap': '10'}], '40152': [{'course': 'MATH F002B02', 'CRN': '40152', 'desc': 'LINEAR ALGEBRA', 'status': 'Waitlist', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5614', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Lee', 'seats': '0', 'wait_seats': '7', 'wait_cap': '10'}, {'course': 'MATH F002B02', 'CRN': '40152', 'desc': 'LINEAR ALGEBRA', 'status': 'Waitlist', 'days': 'F', 'time': '10:00 AM-10:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5614', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Lee', 'seats': '0', 'wait_seats': '7', 'wait_cap': '10'}], '40954': [{'course': 'MATH F002B03', 'CRN': '40954', 'desc': 'LINEAR ALGEBRA', 'status': 'Waitlist', 'days': 'MW', 'time': '06:00 PM-08:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5502', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Papay', 'seats': '0', 'wait_seats': '8', 'wait_cap': '10'}]}, '10': {'40153': [{'course': 'MATH F010.01Y', 'CRN': '40153', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'M', 'time': '08:00 AM-09:30 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5502', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Martinez', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F010.01Y', 'CRN': '40153', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Martinez', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}], '40335': [{'course': 'MATH F010.02', 'CRN': '40335', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'TTh', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Munoz', 'seats': '26', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F010.02', 'CRN': '40335', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'F', 'time': '09:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Munoz', 'seats': '26', 'wait_seats': '10', 'wait_cap': '10'}], '40156': [{'course': 'MATH F010.03W', 'CRN': '40156', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Waitlist', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Low', 'seats': '0', 'wait_seats': '9', 'wait_cap': '10'}], '40523': [{'course': 'MATH F010.04', 'CRN': '40523', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'F', 'time': '10:00 AM-10:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4606', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Tomutiu', 'seats': '28', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F010.04', 'CRN': '40523', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4606', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Tomutiu', 'seats': '28', 'wait_seats': '10', 'wait_cap': '10'}], '40755': [{'course': 'MATH F010.05', 'CRN': '40755', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Waitlist', 'days': 'F', 'time': '11:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4606', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Morriss', 'seats': '0', 'wait_seats': '4', 'wait_cap': '10'}, {'course': 'MATH F010.05', 'CRN': '40755', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Waitlist', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4606', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Morriss', 'seats': '0', 'wait_seats': '4', 'wait_cap': '10'}], '40519': [{'course': 'MATH F010.06', 'CRN': '40519', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'TThF', 'time': '12:00 PM-01:25 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4310', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Francisco', 'seats': '28', 'wait_seats': '10', 'wait_cap': '10'}], '40374': [{'course': 'MATH F010.07', 'CRN': '40374', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Waitlist', 'days': 'TTh', 'time': '01:30 PM-03:45 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4604', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Morriss', 'seats': '0', 'wait_seats': '8', 'wait_cap': '10'}], '42227': [{'course': 'MATH F010.07Y', 'CRN': '42227', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'F', 'time': '11:00 AM-12:20 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'SV203', 'campus': 'FC', 'units': '  5.00', 'instructor': 'Martinez', 'seats': '25', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F010.07Y', 'CRN': '42227', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FC', 'units': '  5.00', 'instructor': 'Martinez', 'seats': '25', 'wait_seats': '10', 'wait_cap': '10'}], '40312': [{'course': 'MATH F010.08W', 'CRN': '40312', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Martinez', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}], '40375': [{'course': 'MATH F010.09W', 'CRN': '40375', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Seelbach', 'seats': '31', 'wait_seats': '10', 'wait_cap': '10'}], '40731': [{'course': 'MATH F010.10W', 'CRN': '40731', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Maskalevich', 'seats': '39', 'wait_seats': '10', 'wait_cap': '10'}], '40903': [{'course': 'MATH F010.11W', 'CRN': '40903', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Maskalevich', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}], '41912': [{'course': 'MATH F010.12', 'CRN': '41912', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'MW', 'time': '01:30 PM-03:45 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Papay', 'seats': '30', 'wait_seats': '10', 'wait_cap': '10'}], '42060': [{'course': 'MATH F010.13W', 'CRN': '42060', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '05/21/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Butterworth', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}], '42157': [{'course': 'MATH F010.14W', 'CRN': '42157', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Low', 'seats': '8', 'wait_seats': '10', 'wait_cap': '10'}], '42224': [{'course': 'MATH F010.15W', 'CRN': '42224', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Seelbach', 'seats': '37', 'wait_seats': '10', 'wait_cap': '10'}], '40525': [{'course': 'MATH F010.50', 'CRN': '40525', 'desc': 'ELEMENTARY STATISTICS', 'status': 'Open', 'days': 'MW', 'time': '06:00 PM-08:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'SV204', 'campus': 'FC', 'units': '  5.00', 'instructor': 'Butterworth', 'seats': '31', 'wait_seats': '10', 'wait_cap': '10'}]}, '12': {'41920': [{'course': 'MATH F012.01Y', 'CRN': '41920', 'desc': 'CALCULUS FOR BUSINESS & ECONOM', 'status': 'Open', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4604', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Knobel', 'seats': '25', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F012.01Y', 'CRN': '41920', 'desc': 'CALCULUS FOR BUSINESS & ECONOM', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Knobel', 'seats': '25', 'wait_seats': '10', 'wait_cap': '10'}], '40376': [{'course': 'MATH F012.50', 'CRN': '40376', 'desc': 'CALCULUS FOR BUSINESS & ECONOM', 'status': 'Open', 'days': 'TTh', 'time': '06:00 PM-08:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'SV209', 'campus': 'FC', 'units': '  5.00', 'instructor': 'Witschorik', 'seats': '12', 'wait_seats': '10', 'wait_cap': '10'}]}, '22': {'40158': [{'course': 'MATH F022.01', 'CRN': '40158', 'desc': 'DISCRETE MATHEMATICS', 'status': 'Waitlist', 'days': 'MW', 'time': '01:30 PM-03:45 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4502', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Morriss', 'seats': '0', 'wait_seats': '10', 'wait_cap': '10'}], '40455': [{'course': 'MATH F022.02', 'CRN': '40455', 'desc': 'DISCRETE MATHEMATICS', 'status': 'Open', 'days': 'MW', 'time': '06:00 PM-08:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Witschorik', 'seats': '4', 'wait_seats': '0', 'wait_cap': '0'}]}, '48A': {'40337': [{'course': 'MATH F048A01', 'CRN': '40337', 'desc': 'PRECALCULUS I', 'status': 'Open', 'days': 'MW', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4605', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Uilecan', 'seats': '26', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F048A01', 'CRN': '40337', 'desc': 'PRECALCULUS I', 'status': 'Open', 'days': 'F', 'time': '08:00 AM-08:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4605', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Uilecan', 'seats': '26', 'wait_seats': '10', 'wait_cap': '10'}], '40338': [{'course': 'MATH F048A03', 'CRN': '40338', 'desc': 'PRECALCULUS I', 'status': 'Open', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4221', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Uilecan', 'seats': '28', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F048A03', 'CRN': '40338', 'desc': 'PRECALCULUS I', 'status': 'Open', 'days': 'F', 'time': '10:00 AM-10:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4221', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Uilecan', 'seats': '28', 'wait_seats': '10', 'wait_cap': '10'}], '40339': [{'course': 'MATH F048A04', 'CRN': '40339', 'desc': 'PRECALCULUS I', 'status': 'Open', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4301', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Zwack', 'seats': '5', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F048A04', 'CRN': '40339', 'desc': 'PRECALCULUS I', 'status': 'Open', 'days': 'F', 'time': '11:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4301', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Zwack', 'seats': '5', 'wait_seats': '10', 'wait_cap': '10'}], '40340': [{'course': 'MATH F048A05', 'CRN': '40340', 'desc': 'PRECALCULUS I', 'status': 'Waitlist', 'days': 'TTh', 'time': '01:30 PM-03:45 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4603', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Zwack', 'seats': '0', 'wait_seats': '9', 'wait_cap': '10'}], '40579': [{'course': 'MATH F048A06', 'CRN': '40579', 'desc': 'PRECALCULUS I', 'status': 'Open', 'days': 'TTh', 'time': '06:00 PM-08:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4605', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Ni', 'seats': '17', 'wait_seats': '10', 'wait_cap': '10'}]}, '48B': {'40341': [{'course': 'MATH F048B01', 'CRN': '40341', 'desc': 'PRECALCULUS II', 'status': 'Open', 'days': 'TTh', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4603', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Cembellin', 'seats': '20', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F048B01', 'CRN': '40341', 'desc': 'PRECALCULUS II', 'status': 'Open', 'days': 'F', 'time': '09:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4603', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Cembellin', 'seats': '20', 'wait_seats': '10', 'wait_cap': '10'}], '40342': [{'course': 'MATH F048B02', 'CRN': '40342', 'desc': 'PRECALCULUS II', 'status': 'Waitlist', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4603', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Zwack', 'seats': '0', 'wait_seats': '3', 'wait_cap': '10'}, {'course': 'MATH F048B02', 'CRN': '40342', 'desc': 'PRECALCULUS II', 'status': 'Waitlist', 'days': 'F', 'time': '10:00 AM-10:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4603', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Zwack', 'seats': '0', 'wait_seats': '3', 'wait_cap': '10'}], '40343': [{'course': 'MATH F048B03', 'CRN': '40343', 'desc': 'PRECALCULUS II', 'status': 'Open', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4310', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Francisco', 'seats': '10', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F048B03', 'CRN': '40343', 'desc': 'PRECALCULUS II', 'status': 'Open', 'days': 'F', 'time': '11:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4310', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Francisco', 'seats': '10', 'wait_seats': '10', 'wait_cap': '10'}], '40379': [{'course': 'MATH F048B04', 'CRN': '40379', 'desc': 'PRECALCULUS II', 'status': 'Open', 'days': 'TThF', 'time': '12:00 PM-01:25 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Nghiem', 'seats': '22', 'wait_seats': '10', 'wait_cap': '10'}]}, '48C': {'40345': [{'course': 'MATH F048C02', 'CRN': '40345', 'desc': 'PRECALCULUS III', 'status': 'Full', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4602', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Francisco', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}, {'course': 'MATH F048C02', 'CRN': '40345', 'desc': 'PRECALCULUS III', 'status': 'Full', 'days': 'F', 'time': '10:00 AM-10:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4602', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Francisco', 'seats': '0', 'wait_seats': '0', 'wait_cap': '10'}], '40380': [{'course': 'MATH F048C03', 'CRN': '40380', 'desc': 'PRECALCULUS III', 'status': 'Open', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4302', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Tomutiu', 'seats': '22', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F048C03', 'CRN': '40380', 'desc': 'PRECALCULUS III', 'status': 'Open', 'days': 'F', 'time': '11:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4302', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Tomutiu', 'seats': '22', 'wait_seats': '10', 'wait_cap': '10'}], '40381': [{'course': 'MATH F048C04', 'CRN': '40381', 'desc': 'PRECALCULUS III', 'status': 'Open', 'days': 'MW', 'time': '01:30 PM-03:45 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4604', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Ni', 'seats': '11', 'wait_seats': '10', 'wait_cap': '10'}], '40575': [{'course': 'MATH F048C05', 'CRN': '40575', 'desc': 'PRECALCULUS III', 'status': 'Waitlist', 'days': 'MW', 'time': '06:00 PM-08:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4602', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Low', 'seats': '0', 'wait_seats': '8', 'wait_cap': '10'}], '40344': [{'course': 'MATH F048CS01', 'CRN': '40344', 'desc': 'PRECALCULUS III', 'status': 'Open', 'days': 'F', 'time': '08:00 AM-08:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Cembellin', 'seats': '14', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F048CS01', 'CRN': '40344', 'desc': 'PRECALCULUS III', 'status': 'Open', 'days': 'MW', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5601', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Cembellin', 'seats': '14', 'wait_seats': '10', 'wait_cap': '10'}]}, '70R': {'40758': [{'course': 'MATH F070R01', 'CRN': '40758', 'desc': 'INDEPENDENT STUDY MATHEMATICS', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'TBA', 'campus': 'FH', 'units': '  1.00', 'instructor': 'Staff', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}]}, '71R': {'40759': [{'course': 'MATH F071R01', 'CRN': '40759', 'desc': 'INDEPENDENT STUDY MATHEMATICS', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'TBA', 'campus': 'FH', 'units': '  2.00', 'instructor': 'Staff', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}], '41575': [{'course': 'MATH F071R02', 'CRN': '41575', 'desc': 'INDEPENDENT STUDY MATHEMATICS', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'TBA', 'campus': 'FH', 'units': '  2.00', 'instructor': 'Staff', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}]}, '72R': {'40760': [{'course': 'MATH F072R01', 'CRN': '40760', 'desc': 'INDEPENDENT STUDY MATHEMATICS', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'TBA', 'campus': 'FH', 'units': '  3.00', 'instructor': 'Staff', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}]}, '73R': {'40761': [{'course': 'MATH F073R01', 'CRN': '40761', 'desc': 'INDEPENDENT STUDY MATHEMATICS', 'status': 'Full', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'TBA', 'campus': 'FH', 'units': '  4.00', 'instructor': 'Staff', 'seats': '0', 'wait_seats': '0', 'wait_cap': '0'}]}, '105': {'40544': [{'course': 'MATH F105.01', 'CRN': '40544', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'F', 'time': '08:00 AM-08:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5609', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Anderson', 'seats': '26', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F105.01', 'CRN': '40544', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'MW', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5609', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Anderson', 'seats': '26', 'wait_seats': '10', 'wait_cap': '10'}], '40159': [{'course': 'MATH F105.02Y', 'CRN': '40159', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Sinclair', 'seats': '18', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F105.02Y', 'CRN': '40159', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4302', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Sinclair', 'seats': '18', 'wait_seats': '10', 'wait_cap': '10'}], '40160': [{'course': 'MATH F105.03Y', 'CRN': '40160', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'T', 'time': '10:00 AM-11:30 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5609', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Martinez', 'seats': '18', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F105.03Y', 'CRN': '40160', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Martinez', 'seats': '18', 'wait_seats': '10', 'wait_cap': '10'}], '40161': [{'course': 'MATH F105.04', 'CRN': '40161', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'F', 'time': '11:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5614', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Anderson', 'seats': '13', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F105.04', 'CRN': '40161', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5614', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Anderson', 'seats': '13', 'wait_seats': '10', 'wait_cap': '10'}], '41952': [{'course': 'MATH F105.05', 'CRN': '41952', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'MWF', 'time': '12:00 PM-01:25 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5610', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Reese', 'seats': '19', 'wait_seats': '10', 'wait_cap': '10'}], '40165': [{'course': 'MATH F105.06Y', 'CRN': '40165', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'McLennan', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F105.06Y', 'CRN': '40165', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'M', 'time': '01:30 PM-03:45 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5607', 'campus': 'FH', 'units': '  5.00', 'instructor': 'McLennan', 'seats': '32', 'wait_seats': '10', 'wait_cap': '10'}], '40348': [{'course': 'MATH F105.07W', 'CRN': '40348', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Perino', 'seats': '16', 'wait_seats': '10', 'wait_cap': '10'}], '40936': [{'course': 'MATH F105.08W', 'CRN': '40936', 'desc': 'INTERMEDIATE ALGEBRA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Williams', 'seats': '9', 'wait_seats': '10', 'wait_cap': '10'}]}, '108': {'42212': [{'course': 'MATH F108.01Y', 'CRN': '42212', 'desc': 'ACCELERATED ALGEBRA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': ' 10.00', 'instructor': 'Sinclair', 'seats': '30', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F108.01Y', 'CRN': '42212', 'desc': 'ACCELERATED ALGEBRA', 'status': 'Open', 'days': 'MTWTh', 'time': '07:30 AM-09:20 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5610', 'campus': 'FH', 'units': ' 10.00', 'instructor': 'Sinclair', 'seats': '30', 'wait_seats': '10', 'wait_cap': '10'}]}, '220': {'40382': [{'course': 'MATH F220.01', 'CRN': '40382', 'desc': 'ELEMENTARY ALGEBRA', 'status': 'Open', 'days': 'F', 'time': '08:00 AM-08:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4602', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Litrus', 'seats': '19', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F220.01', 'CRN': '40382', 'desc': 'ELEMENTARY ALGEBRA', 'status': 'Open', 'days': 'MW', 'time': '08:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4602', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Litrus', 'seats': '19', 'wait_seats': '10', 'wait_cap': '10'}], '40167': [{'course': 'MATH F220.02', 'CRN': '40167', 'desc': 'ELEMENTARY ALGEBRA', 'status': 'Open', 'days': 'F', 'time': '11:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4221', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Litrus', 'seats': '14', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F220.02', 'CRN': '40167', 'desc': 'ELEMENTARY ALGEBRA', 'status': 'Open', 'days': 'TTh', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4221', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Litrus', 'seats': '14', 'wait_seats': '10', 'wait_cap': '10'}], '42058': [{'course': 'MATH F220.03Y', 'CRN': '42058', 'desc': 'ELEMENTARY ALGEBRA', 'status': 'Open', 'days': 'MW', 'time': '10:00 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5610', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Perino', 'seats': '12', 'wait_seats': '10', 'wait_cap': '10'}, {'course': 'MATH F220.03Y', 'CRN': '42058', 'desc': 'ELEMENTARY ALGEBRA', 'status': 'Open', 'days': 'TBA', 'time': 'TBA', 'start': '04/09/2018', 'end': '06/29/2018', 'room': 'ONLINE', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Perino', 'seats': '12', 'wait_seats': '10', 'wait_cap': '10'}], '40724': [{'course': 'MATH F220.04', 'CRN': '40724', 'desc': 'ELEMENTARY ALGEBRA', 'status': 'Open', 'days': 'MW', 'time': '01:30 PM-03:45 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5609', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Low', 'seats': '15', 'wait_seats': '10', 'wait_cap': '10'}], '40935': [{'course': 'MATH F220.05', 'CRN': '40935', 'desc': 'ELEMENTARY ALGEBRA', 'status': 'Open', 'days': 'TTh', 'time': '01:30 PM-03:45 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '4605', 'campus': 'FH', 'units': '  5.00', 'instructor': 'Lieberman', 'seats': '28', 'wait_seats': '10', 'wait_cap': '10'}]}, '230': {'40170': [{'course': 'MATH F230.01', 'CRN': '40170', 'desc': 'PREP FOR ALGEBRA: LINEAR EQ/PR', 'status': 'Open', 'days': 'MTWThF', 'time': '10:00 AM-10:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5602', 'campus': 'FH', 'units': '  6.00', 'instructor': 'Lam', 'seats': '31', 'wait_seats': '15', 'wait_cap': '15'}, {'course': 'MATH F230.01', 'CRN': '40170', 'desc': 'PREP FOR ALGEBRA: LINEAR EQ/PR', 'status': 'Open', 'days': 'MTWThF', 'time': '10:50 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5602', 'campus': 'FH', 'units': '  6.00', 'instructor': 'Lam', 'seats': '31', 'wait_seats': '15', 'wait_cap': '15'}], '41221': [{'course': 'MATH F230.05', 'CRN': '41221', 'desc': 'PREP FOR ALGEBRA: LINEAR EQ/PR', 'status': 'Open', 'days': 'MTWTh', 'time': '06:00 PM-06:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5613', 'campus': 'FH', 'units': '  6.00', 'instructor': 'Reed', 'seats': '7', 'wait_seats': '5', 'wait_cap': '5'}, {'course': 'MATH F230.05', 'CRN': '41221', 'desc': 'PREP FOR ALGEBRA: LINEAR EQ/PR', 'status': 'Open', 'days': 'MTWTh', 'time': '07:00 PM-08:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5613', 'campus': 'FH', 'units': '  6.00', 'instructor': 'Reed', 'seats': '7', 'wait_seats': '5', 'wait_cap': '5'}]}, '230J': {'40350': [{'course': 'MATH F230J01', 'CRN': '40350', 'desc': 'PREPARING FOR ALGEBRA', 'status': 'Open', 'days': 'TThF', 'time': '09:00 AM-09:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5607', 'campus': 'FH', 'units': '  3.00', 'instructor': 'Sukumar', 'seats': '23', 'wait_seats': '10', 'wait_cap': '10'}], '42232': [{'course': 'MATH F230J02', 'CRN': '42232', 'desc': 'PREPARING FOR ALGEBRA', 'status': 'Open', 'days': 'TTh', 'time': '06:00 PM-07:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5612', 'campus': 'FH', 'units': '  3.00', 'instructor': 'Reed', 'seats': '1', 'wait_seats': '0', 'wait_cap': '0'}]}, '235': {'40172': [{'course': 'MATH F235.01', 'CRN': '40172', 'desc': 'PREPARING ALGEBRA:REAL NUMBERS', 'status': 'Waitlist', 'days': 'MTWThF', 'time': '10:00 AM-10:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5602', 'campus': 'FH', 'units': '  6.00', 'instructor': 'Lam', 'seats': '0', 'wait_seats': '15', 'wait_cap': '15'}, {'course': 'MATH F235.01', 'CRN': '40172', 'desc': 'PREPARING ALGEBRA:REAL NUMBERS', 'status': 'Waitlist', 'days': 'MTWThF', 'time': '10:50 AM-11:50 AM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5602', 'campus': 'FH', 'units': '  6.00', 'instructor': 'Lam', 'seats': '0', 'wait_seats': '15', 'wait_cap': '15'}], '41220': [{'course': 'MATH F235.05', 'CRN': '41220', 'desc': 'PREPARING ALGEBRA:REAL NUMBERS', 'status': 'Open', 'days': 'MTWTh', 'time': '06:00 PM-06:50 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5613', 'campus': 'FH', 'units': '  6.00', 'instructor': 'Reed', 'seats': '2', 'wait_seats': '5', 'wait_cap': '5'}, {'course': 'MATH F235.05', 'CRN': '41220', 'desc': 'PREPARING ALGEBRA:REAL NUMBERS', 'status': 'Open', 'days': 'MTWTh', 'time': '07:00 PM-08:15 PM', 'start': '04/09/2018', 'end': '06/29/2018', 'room': '5613', 'campus': 'FH', 'units': '  6.00', 'instructor': 'Reed', 'seats': '2', 'wait_seats': '5', 'wait_cap': '5'}]}}]]
@@ -1,10 +1,15 @@
+from os import replace
 from os.path import join
-from unittest import TestCase
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
 
 from tinydb import TinyDB
 
 import settings
-from server import generate_url, get_one, get_many
+from server import application, generate_url, get_one, get_many, \
+    filter_courses, canonicalize_filters, snapshot_generation, FilterCache, \
+    get_stats, add_section, new_stats, StatsCache
 
 # Try to get generated data.
 try:
@@ -139,3 +144,332 @@ class TestFilters(TestCase):
             1,
             len(result[0].keys())
         )
+
+
+class TestFilterCourses(TestCase):
+    def test_filter_courses_does_not_mutate_course(self):
+        course = get_one(db=test_database, data={'dept': 'CS', 'course': '1A'},
+                         filters=dict())
+        keys = set(course.keys())
+
+        result = filter_courses({'status': {'open':0, 'waitlist':1, 'full':0}}, course)
+
+        self.assertEqual(keys, set(course.keys()))
+        self.assertEqual(1, len(result.keys()))
+
+
+class TestCanonicalizeFilters(TestCase):
+    def test_equivalent_filters_have_same_key(self):
+        a = {'status': {'open':1, 'waitlist':0, 'full':0},
+             'days': {'M':1, 'W':True}}
+        b = {'days': {'W':1, 'M':1, 'F':0}, 'status': {'open':True}}
+
+        self.assertEqual(canonicalize_filters(a), canonicalize_filters(b))
+
+    def test_empty_filters_have_empty_key(self):
+        self.assertEqual((), canonicalize_filters(None))
+        self.assertEqual((), canonicalize_filters(dict()))
+
+    def test_different_filters_have_different_keys(self):
+        a = {'status': {'open':1, 'waitlist':0, 'full':0}}
+        b = {'status': {'open':1, 'waitlist':1, 'full':0}}
+
+        self.assertNotEqual(canonicalize_filters(a), canonicalize_filters(b))
+
+
+class TestFilterCache(TestCase):
+    def setUp(self):
+        self.cache = FilterCache(maxsize=2)
+        self.generation = self.cache.sync('test', 1)
+
+    def make_key(self, data, filters=dict()):
+        return self.cache.make_key('test', self.generation, data, filters)
+
+    def test_get_many_with_cache_matches_uncached(self):
+        data = [{'dept':'CS', 'course':'1A'}, {'dept':'CS', 'course':'2A'}]
+        filters = {'status': {'open':0, 'waitlist':1, 'full':0}}
+
+        expected = get_many(db=test_database, data=data, filters=filters)
+        first = get_many(db=test_database, data=data, filters=filters,
+                         cache=self.cache, campus='test',
+                         generation=self.generation)
+        second = get_many(db=test_database, data=data, filters=filters,
+                          cache=self.cache, campus='test',
+                          generation=self.generation)
+
+        self.assertEqual(expected, first)
+        self.assertEqual(expected, second)
+        self.assertEqual(2, self.cache.misses)
+        self.assertEqual(2, self.cache.hits)
+
+    def test_get_many_dept_hits_cache_with_any_filters(self):
+        data = [{'dept':'CS'}]
+
+        for filters in (dict(), {'status': {'open':1}}, {'days': {'M':1}}):
+            get_many(db=test_database, data=data, filters=filters,
+                     cache=self.cache, campus='test',
+                     generation=self.generation)
+
+        self.assertEqual(1, len(self.cache))
+        self.assertEqual(1, self.cache.misses)
+        self.assertEqual(2, self.cache.hits)
+
+    def test_get_many_does_not_cache_missing_selectors(self):
+        data = [{'dept':'CS', 'course':'NOTACOURSE'}, {'dept':'NOTADEPT'}]
+
+        get_many(db=test_database, data=data, filters=dict(),
+                 cache=self.cache, campus='test', generation=self.generation)
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        keys = [self.make_key({'dept':'CS', 'course':c}) for c in ('1A', '1B', '1C')]
+        self.cache.put(keys[0], 'a')
+        self.cache.put(keys[1], 'b')
+        self.cache.get(keys[0])
+        self.cache.put(keys[2], 'c')
+
+        self.assertEqual(2, len(self.cache))
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertEqual('a', self.cache.get(keys[0]))
+
+    def test_make_key_converts_selectors_like_get_one(self):
+        self.assertEqual(
+            self.make_key({'dept':'CS', 'course':1}),
+            self.make_key({'dept':'CS', 'course':'1'})
+        )
+        self.assertNotEqual(
+            self.make_key({'dept':'CS'}),
+            self.make_key({'dept':'CS', 'course':None})
+        )
+        hash(self.make_key({'dept':'CS', 'course':['1A']}))
+
+    def test_sync_with_new_generation_invalidates_campus(self):
+        key = self.make_key({'dept':'CS', 'course':'1A'})
+        self.cache.put(key, 'a')
+
+        self.assertEqual(2, self.cache.sync('test', 2))
+        self.assertEqual(0, len(self.cache))
+
+    def test_put_after_sync_drops_stale_generation(self):
+        key = self.make_key({'dept':'CS', 'course':'1A'})
+
+        self.cache.sync('test', 2)
+        self.cache.put(key, 'a')
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_replacing_database_file_invalidates_campus(self):
+        with TemporaryDirectory() as tmp:
+            path = join(tmp, 'test_database.json')
+            copyfile(join(settings.TEST_DB_DIR, 'test_database.json'), path)
+            data = [{'dept':'CS', 'course':'1A'}]
+
+            def batch():
+                generation = self.cache.sync('test', snapshot_generation(path))
+                get_many(db=TinyDB(path), data=data, filters=dict(),
+                         cache=self.cache, campus='test', generation=generation)
+
+            batch()
+            self.assertEqual(1, len(self.cache))
+
+            # Unchanged file keeps the cached entries
+            batch()
+            self.assertEqual(1, self.cache.hits)
+
+            # Rewritten in place
+            TinyDB(path).table('CS').insert({'1A': {}})
+            self.cache.sync('test', snapshot_generation(path))
+            self.assertEqual(0, len(self.cache))
+
+            batch()
+            self.assertEqual(1, len(self.cache))
+
+            # Replaced the way data_scraper.py does
+            temp_path = join(tmp, 'temp.json')
+            copyfile(join(settings.TEST_DB_DIR, 'test_database.json'), temp_path)
+            replace(temp_path, path)
+            self.cache.sync('test', snapshot_generation(path))
+            self.assertEqual(0, len(self.cache))
+
+
+class TestApiMany(TestCase):
+    def setUp(self):
+        self.cache = FilterCache()
+        patches = (mock.patch('server.DB_ROOT', settings.TEST_DB_DIR),
+                   mock.patch('server.BATCH_CACHE', self.cache))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.client = application.test_client()
+
+    def test_api_many_with_null_filters(self):
+        body = {'courses': [{'dept':'CS', 'course':'1A'}], 'filters': None}
+
+        response = self.client.post('/test/batch', json=body)
+
+        self.assertEqual(200, response.status_code)
+
+    def test_api_many_with_unhashable_course_returns_404(self):
+        body = {'courses': [{'dept':'CS', 'course':['1A']}]}
+
+        response = self.client.post('/test/batch', json=body)
+
+        self.assertEqual(404, response.status_code)
+
+    def test_api_many_repeated_request_hits_cache(self):
+        body = {'courses': [{'dept':'CS', 'course':'1A'}],
+                'filters': {'status': {'open':1, 'waitlist':0, 'full':0}}}
+
+        first = self.client.post('/test/batch', json=body)
+        second = self.client.post('/test/batch', json=body)
+
+        self.assertEqual(first.get_json(), second.get_json())
+        self.assertEqual(1, self.cache.misses)
+        self.assertEqual(1, self.cache.hits)
+
+
+class TestGetStats(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.stats = get_stats(test_database)
+
+    def test_get_stats_course_counts_sections(self):
+        course = get_one(db=test_database, data={'dept': 'CS', 'course': '1A'},
+                         filters=dict())
+        result = self.stats['CS']['courses']['1A']
+
+        self.assertEqual(len(course), result['sections'])
+        self.assertEqual(len(course), sum(result['status'].values()))
+        self.assertEqual(len(course), sum(result['types'].values()))
+        self.assertEqual(
+            sum(int(c[0]['seats']) for c in course.values()),
+            result['seats']
+        )
+
+    def test_get_stats_status_matches_filter(self):
+        data = {'courses': [{'dept':'CS', 'course':'1A'}],
+                'filters': {'status': {'open':0, 'waitlist':1, 'full':0}}}
+
+        result = get_many(db=test_database, data=data['courses'], filters=data['filters'])
+
+        self.assertEqual(
+            len(result[0].keys()),
+            self.stats['CS']['courses']['1A']['status']['waitlist']
+        )
+
+    def test_get_stats_dept_sums_courses(self):
+        dept = self.stats['CS']
+        courses = dept['courses'].values()
+
+        self.assertEqual(sum(c['sections'] for c in courses), dept['sections'])
+        self.assertEqual(sum(c['wait_seats'] for c in courses), dept['wait_seats'])
+        self.assertEqual(min(c['units']['min'] for c in courses), dept['units']['min'])
+        self.assertEqual(max(c['units']['max'] for c in courses), dept['units']['max'])
+
+    def test_get_stats_types_have_same_keys(self):
+        keys = {tuple(sorted(d['types'])) for d in self.stats.values()}
+        keys |= {tuple(sorted(c['types'])) for d in self.stats.values()
+                 for c in d['courses'].values()}
+
+        self.assertEqual({('hybrid', 'online', 'other', 'standard')}, keys)
+
+    def test_get_stats_status_have_same_keys(self):
+        keys = {tuple(sorted(d['status'])) for d in self.stats.values()}
+        keys |= {tuple(sorted(c['status'])) for d in self.stats.values()
+                 for c in d['courses'].values()}
+
+        self.assertEqual({('full', 'open', 'other', 'waitlist')}, keys)
+
+    def test_get_stats_merges_duplicate_course_keys(self):
+        with TemporaryDirectory() as tmp:
+            db = TinyDB(join(tmp, 'test_database.json'))
+            section = first_section()
+            db.table('CS').insert({'1A': {'1': [section]}})
+            db.table('CS').insert({'1A': {'2': [section]}, '1B': {'3': [section]}})
+
+            dept = get_stats(db)['CS']
+
+            self.assertEqual(2, dept['courses']['1A']['sections'])
+            self.assertEqual(
+                dept['sections'],
+                sum(c['sections'] for c in dept['courses'].values())
+            )
+
+
+class TestAddSection(TestCase):
+    def test_add_section_counts_unparsable_course_as_other(self):
+        stats = new_stats()
+        class_ = {'course': 'NOT A COURSE', 'status': 'Open', 'seats': '5',
+                  'wait_seats': '0', 'units': '  4.00'}
+
+        add_section(stats, class_)
+
+        self.assertEqual(1, stats['types']['other'])
+        self.assertEqual(5, stats['seats'])
+
+    def test_add_section_counts_unknown_status_as_other(self):
+        stats = new_stats()
+        class_ = dict(first_section(), status='Cancelled')
+
+        add_section(stats, class_)
+
+        self.assertEqual(1, stats['status']['other'])
+        self.assertEqual({'open', 'waitlist', 'full', 'other'}, set(stats['status']))
+
+
+class TestStatsCache(TestCase):
+    def test_stats_cache_recomputes_only_on_new_snapshot(self):
+        with TemporaryDirectory() as tmp:
+            path = join(tmp, 'test_database.json')
+            copyfile(join(settings.TEST_DB_DIR, 'test_database.json'), path)
+            cache = StatsCache()
+
+            with mock.patch('server.get_stats', wraps=get_stats) as compute:
+                first = cache.get('test', path)
+                second = cache.get('test', path)
+                self.assertIs(first, second)
+                self.assertEqual(1, compute.call_count)
+
+                TinyDB(path).table('NEW').insert(
+                    {'1A': {'1': [dict(first_section(), course='NEW F001A01')]}})
+                third = cache.get('test', path)
+                self.assertEqual(2, compute.call_count)
+                self.assertIn('NEW', third)
+                self.assertNotIn('NEW', first)
+
+
+class TestApiStats(TestCase):
+    def setUp(self):
+        patches = (mock.patch('server.DB_ROOT', settings.TEST_DB_DIR),
+                   mock.patch('server.STATS_CACHE', StatsCache()))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.client = application.test_client()
+
+    def test_api_stats_all_depts(self):
+        response = self.client.get('/test/stats')
+
+        self.assertEqual(200, response.status_code)
+        self.assertIn('CS', response.get_json())
+
+    def test_api_stats_dept_is_case_insensitive(self):
+        response = self.client.get('/test/stats?dept=cs')
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            get_stats(test_database)['CS'],
+            response.get_json()
+        )
+
+    def test_api_stats_unknown_dept_returns_404(self):
+        response = self.client.get('/test/stats?dept=NOTADEPT')
+
+        self.assertEqual(404, response.status_code)
+
+
+def first_section():
+    dept = test_database.table('CS').all()
+    course = next(e['1A'] for e in dept if '1A' in e)
+    return next(iter(course.values()))[0]